@@ -1,5 +1,6 @@
 """Database initialization and connection management for Beacon."""
 
+import functools
 import sqlite3
 from pathlib import Path
 
@@ -20,11 +21,25 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
 def init_db(db_path: Path | str | None = None) -> None:
     """Initialize the database with the schema."""
     conn = get_connection(db_path)
-    schema = SCHEMA_PATH.read_text()
-    conn.executescript(schema)
+    init_schema(conn)
+    conn.close()
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    """Apply the schema and migrations to an already-open connection.
+
+    Lets callers holding a ``:memory:`` connection (which would vanish if
+    ``init_db`` opened and closed its own) get the same schema.
+    """
+    conn.executescript(_schema_sql())
     _run_migrations(conn)
     conn.commit()
-    conn.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_sql() -> str:
+    """The schema DDL, read from disk once per process."""
+    return SCHEMA_PATH.read_text()
 
 
 def _run_migrations(conn: sqlite3.Connection) -> None:
@@ -1,10 +1,45 @@
 """Professional profile database operations for Beacon Phase 3."""
 
+import functools
 import json
 import sqlite3
 
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a table and column set, once per combination.
+
+    sqlite3 already reuses prepared statements for identical SQL text; caching
+    the string as well skips rebuilding it on every update call.
+    """
+    sets = [f"{column} = ?" for column in columns]
+    sets.append("updated_at = datetime('now')")
+    return f"UPDATE {table} SET {', '.join(sets)} WHERE id = ?"
+
+
+def _update_row(
+    conn: sqlite3.Connection,
+    table: str,
+    row_id: int,
+    fields: dict,
+    json_fields: frozenset[str] = frozenset(),
+) -> bool:
+    """Apply ``fields`` to one row, JSON-encoding list values in ``json_fields``. Returns True if found."""
+    params = [
+        json.dumps(value) if key in json_fields and isinstance(value, list) else value
+        for key, value in fields.items()
+    ]
+    params.append(row_id)
+    cursor = conn.execute(_update_sql(table, tuple(fields)), params)
+    conn.commit()
+    return cursor.rowcount > 0
+
+
 # --- Work Experiences ---
 
+_WORK_EXPERIENCE_JSON_FIELDS = frozenset({"key_achievements", "technologies", "metrics"})
+
+
 def add_work_experience(
     conn: sqlite3.Connection,
     company: str,
@@ -49,22 +84,7 @@ def update_work_experience(conn: sqlite3.Connection, exp_id: int, **kwargs) -> b
     """Update a work experience. Returns True if found."""
     if not kwargs:
         return False
-    json_fields = {"key_achievements", "technologies", "metrics"}
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        if key in json_fields and isinstance(value, list):
-            params.append(json.dumps(value))
-        else:
-            params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(exp_id)
-    cursor = conn.execute(
-        f"UPDATE work_experiences SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "work_experiences", exp_id, kwargs, _WORK_EXPERIENCE_JSON_FIELDS)
 
 
 def delete_work_experience(conn: sqlite3.Connection, exp_id: int) -> bool:
@@ -76,6 +96,9 @@ def delete_work_experience(conn: sqlite3.Connection, exp_id: int) -> bool:
 
 # --- Projects ---
 
+_PROJECT_JSON_FIELDS = frozenset({"technologies", "outcomes"})
+
+
 def add_project(
     conn: sqlite3.Connection,
     name: str,
@@ -120,22 +143,7 @@ def update_project(conn: sqlite3.Connection, project_id: int, **kwargs) -> bool:
     """Update a project. Returns True if found."""
     if not kwargs:
         return False
-    json_fields = {"technologies", "outcomes"}
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        if key in json_fields and isinstance(value, list):
-            params.append(json.dumps(value))
-        else:
-            params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(project_id)
-    cursor = conn.execute(
-        f"UPDATE projects SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "projects", project_id, kwargs, _PROJECT_JSON_FIELDS)
 
 
 def delete_project(conn: sqlite3.Connection, project_id: int) -> bool:
@@ -147,6 +155,9 @@ def delete_project(conn: sqlite3.Connection, project_id: int) -> bool:
 
 # --- Skills ---
 
+_SKILL_JSON_FIELDS = frozenset({"evidence"})
+
+
 def add_skill(
     conn: sqlite3.Connection,
     name: str,
@@ -161,24 +172,19 @@ def add_skill(
     ).fetchone()
 
     if existing:
-        # Update existing skill
-        sets = ["updated_at = datetime('now')"]
-        params: list = []
-        if category is not None:
-            sets.append("category = ?")
-            params.append(category)
-        if proficiency is not None:
-            sets.append("proficiency = ?")
-            params.append(proficiency)
-        if years_experience is not None:
-            sets.append("years_experience = ?")
-            params.append(years_experience)
-        if evidence is not None:
-            sets.append("evidence = ?")
-            params.append(json.dumps(evidence))
-        params.append(existing["id"])
-        conn.execute(f"UPDATE skills SET {', '.join(sets)} WHERE id = ?", params)
-        conn.commit()
+        # Update existing skill, touching only the fields that were passed
+        fields = {
+            key: value
+            for key, value in (
+                ("category", category),
+                ("proficiency", proficiency),
+                ("years_experience", years_experience),
+                # Always encoded, whatever its type, exactly as the insert branch does
+                ("evidence", json.dumps(evidence) if evidence is not None else None),
+            )
+            if value is not None
+        }
+        _update_row(conn, "skills", existing["id"], fields)
         return existing["id"]
     else:
         cursor = conn.execute(
@@ -211,22 +217,7 @@ def update_skill(conn: sqlite3.Connection, skill_id: int, **kwargs) -> bool:
     """Update a skill. Returns True if found."""
     if not kwargs:
         return False
-    json_fields = {"evidence"}
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        if key in json_fields and isinstance(value, list):
-            params.append(json.dumps(value))
-        else:
-            params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(skill_id)
-    cursor = conn.execute(
-        f"UPDATE skills SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "skills", skill_id, kwargs, _SKILL_JSON_FIELDS)
 
 
 def delete_skill(conn: sqlite3.Connection, skill_id: int) -> bool:
@@ -238,6 +229,9 @@ def delete_skill(conn: sqlite3.Connection, skill_id: int) -> bool:
 
 # --- Education ---
 
+_EDUCATION_JSON_FIELDS = frozenset({"relevant_coursework"})
+
+
 def add_education(
     conn: sqlite3.Connection,
     institution: str,
@@ -274,22 +268,7 @@ def update_education(conn: sqlite3.Connection, edu_id: int, **kwargs) -> bool:
     """Update an education entry. Returns True if found."""
     if not kwargs:
         return False
-    json_fields = {"relevant_coursework"}
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        if key in json_fields and isinstance(value, list):
-            params.append(json.dumps(value))
-        else:
-            params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(edu_id)
-    cursor = conn.execute(
-        f"UPDATE education SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "education", edu_id, kwargs, _EDUCATION_JSON_FIELDS)
 
 
 def delete_education(conn: sqlite3.Connection, edu_id: int) -> bool:
@@ -341,18 +320,7 @@ def update_publication(conn: sqlite3.Connection, pub_id: int, **kwargs) -> bool:
     """Update a publication. Returns True if found."""
     if not kwargs:
         return False
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(pub_id)
-    cursor = conn.execute(
-        f"UPDATE publications_talks SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "publications_talks", pub_id, kwargs)
 
 
 def delete_publication(conn: sqlite3.Connection, pub_id: int) -> bool:
@@ -422,18 +390,7 @@ def update_application(conn: sqlite3.Connection, app_id: int, **kwargs) -> bool:
     """Update an application. Returns True if found."""
     if not kwargs:
         return False
-    sets = []
-    params = []
-    for key, value in kwargs.items():
-        sets.append(f"{key} = ?")
-        params.append(value)
-    sets.append("updated_at = datetime('now')")
-    params.append(app_id)
-    cursor = conn.execute(
-        f"UPDATE applications SET {', '.join(sets)} WHERE id = ?", params,
-    )
-    conn.commit()
-    return cursor.rowcount > 0
+    return _update_row(conn, "applications", app_id, kwargs)
 
 
 def delete_application(conn: sqlite3.Connection, app_id: int) -> bool:
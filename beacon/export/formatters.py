@@ -211,33 +211,54 @@ def export_jobs_digest(conn: sqlite3.Connection, since_date: str, min_relevance:
         since_date: ISO date string (YYYY-MM-DD) to filter from.
         min_relevance: Minimum relevance score to include.
     """
+    return render_digest(build_digest(conn, since_date, min_relevance))
+
+
+def build_digest(conn: sqlite3.Connection, since_date: str, min_relevance: float = 7.0) -> dict:
+    """Collect the data behind a job digest without rendering it.
+
+    Returns a dict with the filter inputs, the generation date, the matching
+    ``jobs`` rows, ``total_jobs``, and ``companies`` mapping each company name
+    to its job count in the order the jobs are listed.
+    """
     from beacon.db.jobs import get_new_jobs_since
 
     jobs = get_new_jobs_since(conn, since_date, min_relevance)
-    now = datetime.now().strftime("%Y-%m-%d")
+    company_counts: dict[str, int] = {}
+    for j in jobs:
+        company_counts[j["company_name"]] = company_counts.get(j["company_name"], 0) + 1
+
+    return {
+        "since_date": since_date,
+        "min_relevance": min_relevance,
+        "generated": datetime.now().strftime("%Y-%m-%d"),
+        "jobs": jobs,
+        "total_jobs": len(jobs),
+        "companies": company_counts,
+    }
+
 
+def render_digest(data: dict) -> str:
+    """Render the output of :func:`build_digest` as Markdown."""
+    now = data["generated"]
     lines = [
         f"# Job Digest — {now}",
         "",
-        f"> Jobs since {since_date} with relevance >= {min_relevance}",
+        f"> Jobs since {data['since_date']} with relevance >= {data['min_relevance']}",
         "",
     ]
 
-    if not jobs:
+    if not data["jobs"]:
         lines.append("No matching jobs found.")
         return "\n".join(lines)
 
-    # Summary stats
-    company_counts: dict[str, int] = {}
-    for j in jobs:
-        company_counts[j["company_name"]] = company_counts.get(j["company_name"], 0) + 1
-
-    lines.append(f"**{len(jobs)} relevant jobs** across **{len(company_counts)} companies**")
+    company_counts = data["companies"]
+    lines.append(f"**{data['total_jobs']} relevant jobs** across **{len(company_counts)} companies**")
     lines.append("")
 
     # Group by company
     current_company = None
-    for j in jobs:
+    for j in data["jobs"]:
         if j["company_name"] != current_company:
             current_company = j["company_name"]
             lines.append(f"## {current_company} ({company_counts[current_company]} jobs)")
@@ -44,6 +44,21 @@ IMPACT_SCORES = {
     "personal": 2,
 }
 
+# Shared by refresh_score and the batched refresh_all_scores
+_UPSERT_BREAKDOWN_SQL = """
+    INSERT INTO score_breakdown (company_id, leadership_score, tool_adoption_score,
+        culture_score, evidence_depth_score, recency_score, composite_score, last_computed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+    ON CONFLICT(company_id) DO UPDATE SET
+        leadership_score = excluded.leadership_score,
+        tool_adoption_score = excluded.tool_adoption_score,
+        culture_score = excluded.culture_score,
+        evidence_depth_score = excluded.evidence_depth_score,
+        recency_score = excluded.recency_score,
+        composite_score = excluded.composite_score,
+        last_computed_at = excluded.last_computed_at
+"""
+
 
 def compute_leadership_score(conn: sqlite3.Connection, company_id: int) -> float:
     """Score based on leadership signals — CEO-level mandates score highest."""
@@ -179,35 +194,24 @@ def compute_composite_score(conn: sqlite3.Connection, company_id: int) -> dict:
     return scores
 
 
+def _breakdown_params(company_id: int, scores: dict) -> tuple:
+    return (
+        company_id,
+        scores["leadership_score"],
+        scores["tool_adoption_score"],
+        scores["culture_score"],
+        scores["evidence_depth_score"],
+        scores["recency_score"],
+        scores["composite_score"],
+    )
+
+
 def refresh_score(conn: sqlite3.Connection, company_id: int) -> float:
     """Recompute and store the score for a single company. Returns composite."""
     scores = compute_composite_score(conn, company_id)
 
     # Upsert into score_breakdown
-    conn.execute(
-        """
-        INSERT INTO score_breakdown (company_id, leadership_score, tool_adoption_score,
-            culture_score, evidence_depth_score, recency_score, composite_score, last_computed_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
-        ON CONFLICT(company_id) DO UPDATE SET
-            leadership_score = excluded.leadership_score,
-            tool_adoption_score = excluded.tool_adoption_score,
-            culture_score = excluded.culture_score,
-            evidence_depth_score = excluded.evidence_depth_score,
-            recency_score = excluded.recency_score,
-            composite_score = excluded.composite_score,
-            last_computed_at = excluded.last_computed_at
-        """,
-        (
-            company_id,
-            scores["leadership_score"],
-            scores["tool_adoption_score"],
-            scores["culture_score"],
-            scores["evidence_depth_score"],
-            scores["recency_score"],
-            scores["composite_score"],
-        ),
-    )
+    conn.execute(_UPSERT_BREAKDOWN_SQL, _breakdown_params(company_id, scores))
 
     # Update the main company table
     conn.execute(
@@ -219,8 +223,24 @@ def refresh_score(conn: sqlite3.Connection, company_id: int) -> float:
 
 
 def refresh_all_scores(conn: sqlite3.Connection) -> int:
-    """Recompute scores for all companies. Returns count updated."""
-    rows = conn.execute("SELECT id FROM companies").fetchall()
-    for row in rows:
-        refresh_score(conn, row["id"])
-    return len(rows)
+    """Recompute scores for all companies. Returns count updated.
+
+    Sub-scores are still computed per company, but the writes are batched:
+    one executemany upsert into score_breakdown, one set-based UPDATE of
+    companies from it, and a single commit.
+    """
+    ids = [row["id"] for row in conn.execute("SELECT id FROM companies").fetchall()]
+    conn.executemany(
+        _UPSERT_BREAKDOWN_SQL,
+        [_breakdown_params(cid, compute_composite_score(conn, cid)) for cid in ids],
+    )
+    conn.execute(
+        """
+        UPDATE companies SET
+            ai_first_score = (SELECT composite_score FROM score_breakdown WHERE company_id = companies.id),
+            updated_at = datetime('now')
+        WHERE id IN (SELECT company_id FROM score_breakdown)
+        """
+    )
+    conn.commit()
+    return len(ids)
@@ -2,12 +2,20 @@
 
 Speeds up the suite by relaxing SQLite durability for *test* databases only.
 
-Every test's ``db`` fixture calls ``init_db``, which fsyncs on commit. On slow
-filesystems (notably WSL2) that single fsync dominates wall-clock at ~2s per
-call; multiplied across the ~1064-test suite it turns a one-minute run into a
-~40-minute one. Tests never need crash durability, so we disable synchronous
-fsync and keep the rollback journal in memory for every connection opened
-during the test session.
+Many test modules still build file-backed databases under ``tmp_path`` (via
+``init_db``), and CLI tests open files by path; each commit on those
+connections fsyncs. On slow filesystems (notably WSL2) that fsync dominates
+wall-clock at ~2s per call, turning a one-minute run into a ~40-minute one.
+Tests never need crash durability, so we disable synchronous fsync and keep
+the rollback journal and temp tables in memory for every connection opened
+during the test session. The shared in-memory ``db`` in ``tests/conftest.py``
+never touches disk, so for it these PRAGMAs are moot; they matter for the
+remaining file-backed connections.
+
+``locking_mode=EXCLUSIVE`` is deliberately left out: several tests open a
+second connection to the same file (e.g. CLI commands resolving
+``DEFAULT_DB_PATH`` while the fixture's connection is still open), and an
+exclusive lock would make those block.
 
 This patches the stdlib ``sqlite3.connect`` so it also covers the connections
 ``init_db`` opens internally (not just the fixture's). It is loaded only by
@@ -23,6 +31,7 @@ def _fast_connect(*args, **kwargs):
     conn = _real_connect(*args, **kwargs)
     conn.execute("PRAGMA synchronous=OFF")
     conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
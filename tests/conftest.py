@@ -0,0 +1,169 @@
+"""Shared fixtures for the beacon test suite.
+
+SQLite tuning for tests lives in the root ``conftest.py``, which patches
+``sqlite3.connect`` so every test connection runs with ``synchronous=OFF``,
+``journal_mode=MEMORY`` and ``temp_store=MEMORY``. The shared connection here
+is in-memory, so it never syncs to disk and no extra PRAGMAs are applied.
+"""
+
+import contextlib
+import sqlite3
+import uuid
+
+import pytest
+
+from beacon.db.connection import init_schema
+from beacon.db.profile import add_education, add_project, add_work_experience
+
+_SAVEPOINT = "beacon_test"
+_TX_SAVEPOINT = "beacon_tx"
+
+
+class _SavepointConnection(sqlite3.Connection):
+    """Connection whose commits and rollbacks stay inside the test savepoint.
+
+    The code under test calls ``commit()`` freely; a real COMMIT would release
+    the per-test savepoint and leak that test's rows into the next one. So
+    while a test runs, an inner savepoint stands in for the transaction:
+    ``commit()`` releases it and opens the next one, and ``rollback()`` undoes
+    only the work since the last commit, as real sqlite3 does. The ``with
+    conn:`` context manager calls the C-level commit directly, so ``__exit__``
+    is overridden as well. ``close()`` is a no-op so code that tidies up after
+    itself cannot end the session; the session fixtures close the connection
+    for real. Outside a test (session setup) commits and rollbacks are real.
+    """
+
+    _in_test = False
+
+    def commit(self):
+        if not self._in_test:
+            return super().commit()
+        self.execute(f"RELEASE {_TX_SAVEPOINT}")
+        self.execute(f"SAVEPOINT {_TX_SAVEPOINT}")
+
+    def rollback(self):
+        if not self._in_test:
+            return super().rollback()
+        self.execute(f"ROLLBACK TO {_TX_SAVEPOINT}")
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def close(self):
+        pass
+
+
+def _open_shared_db():
+    """Open a schema-initialized in-memory database on a savepoint connection.
+
+    The database is a named in-memory URI rather than a ``tmp_path`` file, so
+    there is no disk I/O at all. The name is a uuid because ``_session_db``
+    and ``populated_session_db`` live in the same process and must not open
+    the same database. Each URI has exactly one connection, so no shared cache.
+    """
+    uri = f"file:beacon_test_{uuid.uuid4().hex}?mode=memory"
+    conn = sqlite3.connect(uri, uri=True, factory=_SavepointConnection)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    init_schema(conn)
+    return conn
+
+
+@contextlib.contextmanager
+def _rolled_back(conn):
+    """Run the enclosed test inside a savepoint that is always undone."""
+    conn.execute(f"SAVEPOINT {_SAVEPOINT}")
+    conn.execute(f"SAVEPOINT {_TX_SAVEPOINT}")
+    conn._in_test = True
+    try:
+        yield conn
+    finally:
+        conn._in_test = False
+        conn.execute(f"ROLLBACK TO {_SAVEPOINT}")
+        conn.execute(f"RELEASE {_SAVEPOINT}")
+
+
+def _populate_profile(conn):
+    """Add the sample profile the resume tests tailor against."""
+    add_work_experience(conn, "DataCo", "Senior Data Engineer", "2022-01",
+                        description="Built data pipelines",
+                        technologies=["Python", "Spark", "dbt", "SQL"],
+                        key_achievements=["Reduced latency by 50%", "Led team of 3"],
+                        metrics=["50% latency reduction"])
+    add_work_experience(conn, "StartupInc", "Data Analyst", "2019-06", end_date="2021-12",
+                        technologies=["Python", "SQL", "Tableau"])
+    add_project(conn, "Beacon", description="Job search intelligence tool",
+                technologies=["Python", "SQLite", "Rich"])
+    conn.executemany(
+        "INSERT INTO skills (name, category, proficiency, years_experience) VALUES (?, ?, ?, ?)",
+        [
+            ("Python", "language", "expert", 10),
+            ("SQL", "language", "advanced", None),
+            ("Spark", "framework", "advanced", None),
+            ("dbt", "tool", "advanced", None),
+            ("JavaScript", "language", "intermediate", None),
+        ],
+    )
+    add_education(conn, "State University", degree="BS", field_of_study="Computer Science")
+
+
+@pytest.fixture(scope="session")
+def _session_db():
+    """One empty-schema connection for the whole session, so the page cache stays warm."""
+    conn = _open_shared_db()
+    yield conn
+    sqlite3.Connection.close(conn)
+
+
+@pytest.fixture(scope="session")
+def schema_tables(_session_db):
+    """Names of every table ``init_schema`` creates, read once per session."""
+    rows = _session_db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return frozenset(row[0] for row in rows)
+
+
+@pytest.fixture
+def db(_session_db):
+    """Shared connection wrapped in a savepoint that is rolled back afterwards."""
+    with _rolled_back(_session_db) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+def populated_session_db():
+    """Connection holding the sample profile, populated once per session.
+
+    Read it directly only for queries that never write; use ``populated_db``
+    to mutate.
+    """
+    conn = _open_shared_db()
+    _populate_profile(conn)
+    conn.commit()
+    yield conn
+    sqlite3.Connection.close(conn)
+
+
+@pytest.fixture
+def populated_db(populated_session_db):
+    """The sample profile, restored after each test by rolling back its savepoint."""
+    with _rolled_back(populated_session_db) as conn:
+        yield conn
+
+
+def _insert_company(conn, name="TestCo"):
+    conn.execute(
+        "INSERT INTO companies (name, remote_policy, size_bucket) VALUES (?, 'hybrid', 'mid-200-1000')",
+        (name,),
+    )
+    conn.commit()
+    return conn.execute("SELECT id FROM companies WHERE name = ?", (name,)).fetchone()["id"]
+
+
+@pytest.fixture
+def insert_company():
+    """``insert_company(conn, name="TestCo")`` adds a minimal company row and returns its id."""
+    return _insert_company
@@ -0,0 +1,36 @@
+"""Tests for the shared savepoint-backed ``db`` fixture in conftest."""
+
+import pytest
+
+
+def _company_names(conn):
+    return [r[0] for r in conn.execute("SELECT name FROM companies ORDER BY id")]
+
+
+class TestSavepointConnection:
+    def test_rollback_keeps_committed_rows(self, db, insert_company):
+        insert_company(db, "Committed")
+        db.execute("INSERT INTO companies (name) VALUES ('Uncommitted')")
+        db.rollback()
+        assert _company_names(db) == ["Committed"]
+
+    def test_failed_with_block_keeps_committed_rows(self, db, insert_company):
+        insert_company(db, "Committed")
+        with pytest.raises(RuntimeError):
+            with db:
+                db.execute("INSERT INTO companies (name) VALUES ('Uncommitted')")
+                raise RuntimeError("boom")
+        assert _company_names(db) == ["Committed"]
+
+    def test_with_block_commits(self, db):
+        with db:
+            db.execute("INSERT INTO companies (name) VALUES ('Kept')")
+        db.rollback()
+        assert _company_names(db) == ["Kept"]
+
+    def test_close_is_a_no_op(self, db):
+        db.close()
+        assert db.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_rows_do_not_leak_between_tests(self, db):
+        assert _company_names(db) == []
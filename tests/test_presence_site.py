@@ -10,6 +10,7 @@ from beacon.db.profile import (
     add_publication,
     add_skill,
     add_work_experience,
+    get_projects,
 )
 from beacon.db.speaker import add_presentation, set_bio, set_headshot
 from beacon.presence.site import (
@@ -110,14 +111,12 @@ class TestGenerateResumePage:
 class TestGenerateProjectPage:
     def test_has_frontmatter(self, db):
         _populate_profile(db)
-        from beacon.db.profile import get_projects
         projects = get_projects(db)
         result = generate_project_page(projects[0])
         assert result.startswith("---")
 
     def test_includes_project_name(self, db):
         _populate_profile(db)
-        from beacon.db.profile import get_projects
         projects = get_projects(db)
         beacon_proj = [p for p in projects if p["name"] == "Beacon"][0]
         result = generate_project_page(beacon_proj)
@@ -125,7 +124,6 @@ class TestGenerateProjectPage:
 
     def test_includes_technologies(self, db):
         _populate_profile(db)
-        from beacon.db.profile import get_projects
         projects = get_projects(db)
         beacon_proj = [p for p in projects if p["name"] == "Beacon"][0]
         result = generate_project_page(beacon_proj)
@@ -134,7 +132,6 @@ class TestGenerateProjectPage:
 
     def test_includes_outcomes(self, db):
         _populate_profile(db)
-        from beacon.db.profile import get_projects
         projects = get_projects(db)
         beacon_proj = [p for p in projects if p["name"] == "Beacon"][0]
         result = generate_project_page(beacon_proj)
@@ -142,7 +139,6 @@ class TestGenerateProjectPage:
 
     def test_includes_repo_link(self, db):
         _populate_profile(db)
-        from beacon.db.profile import get_projects
         projects = get_projects(db)
         beacon_proj = [p for p in projects if p["name"] == "Beacon"][0]
         result = generate_project_page(beacon_proj)
@@ -225,41 +221,18 @@ class TestGenerateAboutPageWithSpeaker:
 
 
 class TestExportSiteContent:
-    def test_creates_files(self, db, tmp_path):
+    def test_export_produces_expected_files(self, db, tmp_path):
         _populate_profile(db)
         output_dir = tmp_path / "site_content"
         files = export_site_content(db, str(output_dir))
+        assert output_dir.exists()
         assert len(files) >= 4  # resume, about, talks, and at least 1 project
-
-    def test_creates_resume(self, db, tmp_path):
-        _populate_profile(db)
-        output_dir = tmp_path / "site_content"
-        files = export_site_content(db, str(output_dir))
-        resume_files = [f for f in files if f.endswith("resume.md")]
-        assert len(resume_files) == 1
-
-    def test_creates_about(self, db, tmp_path):
-        _populate_profile(db)
-        output_dir = tmp_path / "site_content"
-        files = export_site_content(db, str(output_dir))
-        about_files = [f for f in files if f.endswith("about.md")]
-        assert len(about_files) == 1
-
-    def test_creates_project_pages(self, db, tmp_path):
-        _populate_profile(db)
-        output_dir = tmp_path / "site_content"
-        files = export_site_content(db, str(output_dir))
-        project_files = [f for f in files if "projects" in f]
-        assert len(project_files) == 2  # Beacon + Internal Tool
+        assert len([f for f in files if f.endswith("resume.md")]) == 1
+        assert len([f for f in files if f.endswith("about.md")]) == 1
+        assert len([f for f in files if "projects" in f]) == 2  # Beacon + Internal Tool
+        assert (output_dir / "resume.md").read_text().startswith("---")
 
     def test_creates_output_directory(self, db, tmp_path):
         output_dir = tmp_path / "new_dir" / "content"
         export_site_content(db, str(output_dir))
         assert output_dir.exists()
-
-    def test_file_content_has_frontmatter(self, db, tmp_path):
-        _populate_profile(db)
-        output_dir = tmp_path / "site_content"
-        export_site_content(db, str(output_dir))
-        resume_content = (output_dir / "resume.md").read_text()
-        assert resume_content.startswith("---")
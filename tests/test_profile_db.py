@@ -1,10 +1,10 @@
 """Tests for professional profile database operations."""
 
 import json
+import sqlite3
 
 import pytest
 
-from beacon.db.connection import get_connection, init_db
 from beacon.db.jobs import upsert_job
 from beacon.db.profile import (
     add_application,
@@ -40,22 +40,9 @@ from beacon.db.profile import (
 )
 
 
-@pytest.fixture
-def db(tmp_path):
-    db_path = tmp_path / "test_beacon.db"
-    init_db(db_path)
-    conn = get_connection(db_path)
-    yield conn
-    conn.close()
-
-
-def _insert_company(conn, name="TestCo"):
-    conn.execute(
-        "INSERT INTO companies (name, remote_policy, size_bucket) VALUES (?, 'hybrid', 'mid-200-1000')",
-        (name,),
-    )
-    conn.commit()
-    return conn.execute("SELECT id FROM companies WHERE name = ?", (name,)).fetchone()["id"]
+def _json_list(conn, text):
+    """Decode a stored JSON array column with SQLite's JSON1 ``json_each``."""
+    return [r["value"] for r in conn.execute("SELECT value FROM json_each(?) ORDER BY key", (text,))]
 
 
 # --- Work Experiences ---
@@ -75,8 +62,8 @@ class TestWorkExperiences:
         )
         row = get_work_experience_by_id(db, exp_id)
         assert row["company"] == "Acme Corp"
-        assert json.loads(row["key_achievements"]) == ["Reduced latency by 50%", "Led team of 3"]
-        assert json.loads(row["technologies"]) == ["Python", "Spark", "dbt"]
+        assert _json_list(db, row["key_achievements"]) == ["Reduced latency by 50%", "Led team of 3"]
+        assert _json_list(db, row["technologies"]) == ["Python", "Spark", "dbt"]
 
     def test_get_work_experiences_all(self, db):
         add_work_experience(db, "Co A", "Engineer", "2020-01", end_date="2022-01")
@@ -101,7 +88,7 @@ class TestWorkExperiences:
         exp_id = add_work_experience(db, "Acme", "Engineer", "2022-01")
         assert update_work_experience(db, exp_id, technologies=["Python", "SQL"]) is True
         row = get_work_experience_by_id(db, exp_id)
-        assert json.loads(row["technologies"]) == ["Python", "SQL"]
+        assert _json_list(db, row["technologies"]) == ["Python", "SQL"]
 
     def test_update_nonexistent_returns_false(self, db):
         assert update_work_experience(db, 99999, title="X") is False
@@ -133,7 +120,7 @@ class TestProjects:
                           outcomes=["Automated 100 reports"])
         row = get_project_by_id(db, pid)
         assert row["work_experience_id"] == exp_id
-        assert json.loads(row["technologies"]) == ["Python", "Airflow"]
+        assert _json_list(db, row["technologies"]) == ["Python", "Airflow"]
 
     def test_get_projects_all(self, db):
         add_project(db, "Project A")
@@ -189,6 +176,17 @@ class TestSkills:
         assert len(skills) == 1
         assert skills[0]["category"] == "language"
 
+    def test_upsert_with_no_fields_keeps_skill(self, db):
+        sid = add_skill(db, "Python", category="language")
+        assert add_skill(db, "Python") == sid
+        assert get_skill_by_id(db, sid)["category"] == "language"
+
+    @pytest.mark.parametrize("evidence", [["Open source contrib"], "Open source contrib", {"a": 1}])
+    def test_upsert_json_encodes_any_evidence(self, db, evidence):
+        sid = add_skill(db, "Python")
+        add_skill(db, "Python", evidence=evidence)
+        assert get_skill_by_id(db, sid)["evidence"] == json.dumps(evidence)
+
     def test_get_skills_by_category(self, db):
         add_skill(db, "Python", category="language")
         add_skill(db, "SQL", category="language")
@@ -208,7 +206,7 @@ class TestSkills:
     def test_skill_evidence_json(self, db):
         sid = add_skill(db, "Python", evidence=["Built pipeline", "Open source contrib"])
         row = get_skill_by_id(db, sid)
-        assert json.loads(row["evidence"]) == ["Built pipeline", "Open source contrib"]
+        assert _json_list(db, row["evidence"]) == ["Built pipeline", "Open source contrib"]
 
 
 # --- Education ---
@@ -221,7 +219,7 @@ class TestEducation:
     def test_add_education_with_coursework(self, db):
         eid = add_education(db, "Stanford", relevant_coursework=["ML", "Databases", "Stats"])
         row = get_education_by_id(db, eid)
-        assert json.loads(row["relevant_coursework"]) == ["ML", "Databases", "Stats"]
+        assert _json_list(db, row["relevant_coursework"]) == ["ML", "Databases", "Stats"]
 
     def test_get_education(self, db):
         add_education(db, "MIT")
@@ -276,14 +274,14 @@ class TestPublications:
 # --- Applications ---
 
 class TestApplications:
-    def test_add_application(self, db):
-        cid = _insert_company(db)
+    def test_add_application(self, db, insert_company):
+        cid = insert_company(db)
         result = upsert_job(db, cid, "Data Engineer", url="https://x.com/1")
         app_id = add_application(db, result["id"])
         assert app_id > 0
 
-    def test_get_applications(self, db):
-        cid = _insert_company(db)
+    def test_get_applications(self, db, insert_company):
+        cid = insert_company(db)
         r1 = upsert_job(db, cid, "Job A", url="https://x.com/a")
         r2 = upsert_job(db, cid, "Job B", url="https://x.com/b")
         add_application(db, r1["id"], status="applied")
@@ -292,8 +290,8 @@ class TestApplications:
         assert len(apps) == 2
         assert apps[0]["company_name"] == "TestCo"
 
-    def test_filter_by_status(self, db):
-        cid = _insert_company(db)
+    def test_filter_by_status(self, db, insert_company):
+        cid = insert_company(db)
         r1 = upsert_job(db, cid, "Job A", url="https://x.com/a")
         r2 = upsert_job(db, cid, "Job B", url="https://x.com/b")
         add_application(db, r1["id"], status="applied")
@@ -301,31 +299,31 @@ class TestApplications:
         apps = get_applications(db, status="applied")
         assert len(apps) == 1
 
-    def test_update_application_status(self, db):
-        cid = _insert_company(db)
+    def test_update_application_status(self, db, insert_company):
+        cid = insert_company(db)
         r = upsert_job(db, cid, "Job", url="https://x.com/1")
         app_id = add_application(db, r["id"])
         assert update_application(db, app_id, status="interview") is True
         app = get_application_by_id(db, app_id)
         assert app["status"] == "interview"
 
-    def test_delete_application(self, db):
-        cid = _insert_company(db)
+    def test_delete_application(self, db, insert_company):
+        cid = insert_company(db)
         r = upsert_job(db, cid, "Job", url="https://x.com/1")
         app_id = add_application(db, r["id"])
         assert delete_application(db, app_id) is True
         assert get_application_by_id(db, app_id) is None
 
-    def test_fk_cascade_on_job_delete(self, db):
-        cid = _insert_company(db)
+    def test_fk_cascade_on_job_delete(self, db, insert_company):
+        cid = insert_company(db)
         r = upsert_job(db, cid, "Job", url="https://x.com/1")
         app_id = add_application(db, r["id"])
         db.execute("DELETE FROM job_listings WHERE id = ?", (r["id"],))
         db.commit()
         assert get_application_by_id(db, app_id) is None
 
-    def test_application_with_paths(self, db):
-        cid = _insert_company(db)
+    def test_application_with_paths(self, db, insert_company):
+        cid = insert_company(db)
         r = upsert_job(db, cid, "Job", url="https://x.com/1")
         app_id = add_application(db, r["id"], resume_path="/tmp/resume.pdf",
                                   cover_letter_path="/tmp/cover.pdf",
@@ -337,35 +335,36 @@ class TestApplications:
 
 # --- Schema Integrity ---
 
-class TestSchemaIntegrity:
-    def test_all_phase3_tables_exist(self, db):
-        tables = db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        ).fetchall()
-        table_names = {t["name"] for t in tables}
-        for expected in ["work_experiences", "projects", "skills", "education", "publications_talks", "applications"]:
-            assert expected in table_names, f"Table {expected} missing"
-
-    def test_skills_unique_constraint(self, db):
-        db.execute("INSERT INTO skills (name, category) VALUES ('Python', 'language')")
-        db.commit()
-        with pytest.raises(Exception):
-            db.execute("INSERT INTO skills (name, category) VALUES ('Python', 'tool')")
-            db.commit()
+@pytest.fixture
+def constraint_db(db, insert_company):
+    """The shared ``db``, seeded with the rows the constraint cases collide with."""
+    db.execute("INSERT INTO skills (name, category) VALUES ('Python', 'language')")
+    upsert_job(db, insert_company(db), "Job", url="https://x.com/1")
+    return db
 
-    def test_publication_type_check_constraint(self, db):
-        with pytest.raises(Exception):
-            db.execute("INSERT INTO publications_talks (title, pub_type) VALUES ('X', 'invalid')")
-            db.commit()
 
-    def test_application_status_check_constraint(self, db):
-        cid = _insert_company(db)
-        r = upsert_job(db, cid, "Job", url="https://x.com/1")
-        with pytest.raises(Exception):
-            db.execute("INSERT INTO applications (job_id, status) VALUES (?, 'invalid')", (r["id"],))
-            db.commit()
-
-    def test_proficiency_check_constraint(self, db):
-        with pytest.raises(Exception):
-            db.execute("INSERT INTO skills (name, proficiency) VALUES ('X', 'godlike')")
-            db.commit()
+class TestSchemaIntegrity:
+    def test_all_phase3_tables_exist(self, schema_tables):
+        for expected in ["work_experiences", "projects", "skills", "education", "publications_talks", "applications"]:
+            assert expected in schema_tables, f"Table {expected} missing"
+
+    @pytest.mark.parametrize("bad_sql", [
+        pytest.param("INSERT INTO skills (name, category) VALUES ('Python', 'tool')", id="skills-unique"),
+        pytest.param("INSERT INTO publications_talks (title, pub_type) VALUES ('X', 'invalid')", id="pub-type"),
+        pytest.param(
+            "INSERT INTO applications (job_id, status) VALUES ((SELECT MIN(id) FROM job_listings), 'invalid')",
+            id="application-status",
+        ),
+        pytest.param("INSERT INTO skills (name, proficiency) VALUES ('X', 'godlike')", id="proficiency"),
+    ])
+    def test_constraint_rejects(self, constraint_db, bad_sql):
+        # A nested savepoint undoes the failed write without touching the
+        # per-test savepoint the shared connection runs inside.
+        constraint_db.execute("SAVEPOINT constraint_case")
+        try:
+            with pytest.raises(sqlite3.IntegrityError):
+                constraint_db.execute(bad_sql)
+                constraint_db.commit()
+        finally:
+            constraint_db.execute("ROLLBACK TO constraint_case")
+            constraint_db.execute("RELEASE constraint_case")
@@ -1,17 +1,10 @@
 """Tests for resume tailoring engine."""
 
-from unittest.mock import patch
+import functools
 
 import pytest
 
-from beacon.db.connection import get_connection, init_db
 from beacon.db.jobs import upsert_job
-from beacon.db.profile import (
-    add_education,
-    add_project,
-    add_skill,
-    add_work_experience,
-)
 from beacon.llm.client import LLMResponse
 from beacon.materials.renderer import render_markdown
 from beacon.materials.resume import (
@@ -22,77 +15,71 @@ from beacon.materials.resume import (
 )
 
 
+@pytest.fixture(scope="module")
+def select_populated(populated_session_db):
+    """Memoized ``select_relevant_items`` over the session's sample profile.
+
+    Call it with tuples of required/preferred skills and keywords; identical
+    requirement sets share a single query pass across the module. Tests that
+    mutate the profile use ``populated_db`` or ``db`` instead.
+    """
+    @functools.lru_cache(maxsize=None)
+    def select(required=(), preferred=(), keywords=()):
+        requirements = {
+            "required_skills": list(required),
+            "preferred_skills": list(preferred),
+            "keywords": list(keywords),
+        }
+        return select_relevant_items(populated_session_db, requirements)
+
+    return select
+
+
+class _FakeLLM:
+    """Plain stand-ins for ``generate``/``generate_structured`` that record prompts."""
+
+    def __init__(self):
+        self.requirements = {}
+        self.response = LLMResponse(text="# Resume", model="test", input_tokens=10, output_tokens=20)
+        self.prompts = []
+        self.structured_prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.response
+
+    def generate_structured(self, prompt, **kwargs):
+        self.structured_prompts.append(prompt)
+        return self.requirements
+
+
 @pytest.fixture
-def db(tmp_path):
-    db_path = tmp_path / "test_beacon.db"
-    init_db(db_path)
-    conn = get_connection(db_path)
-    yield conn
-    conn.close()
-
-
-def _insert_company(conn, name="TestCo"):
-    conn.execute(
-        "INSERT INTO companies (name, remote_policy, size_bucket) VALUES (?, 'hybrid', 'mid-200-1000')",
-        (name,),
-    )
-    conn.commit()
-    return conn.execute("SELECT id FROM companies WHERE name = ?", (name,)).fetchone()["id"]
-
-
-def _populate_profile(conn):
-    """Add sample profile data for testing."""
-    add_work_experience(conn, "DataCo", "Senior Data Engineer", "2022-01",
-                        description="Built data pipelines",
-                        technologies=["Python", "Spark", "dbt", "SQL"],
-                        key_achievements=["Reduced latency by 50%", "Led team of 3"],
-                        metrics=["50% latency reduction"])
-    add_work_experience(conn, "StartupInc", "Data Analyst", "2019-06", end_date="2021-12",
-                        technologies=["Python", "SQL", "Tableau"])
-    add_project(conn, "Beacon", description="Job search intelligence tool",
-                technologies=["Python", "SQLite", "Rich"])
-    add_skill(conn, "Python", category="language", proficiency="expert", years_experience=10)
-    add_skill(conn, "SQL", category="language", proficiency="advanced")
-    add_skill(conn, "Spark", category="framework", proficiency="advanced")
-    add_skill(conn, "dbt", category="tool", proficiency="advanced")
-    add_skill(conn, "JavaScript", category="language", proficiency="intermediate")
-    add_education(conn, "State University", degree="BS", field_of_study="Computer Science")
+def fake_llm(monkeypatch):
+    fake = _FakeLLM()
+    monkeypatch.setattr("beacon.materials.resume.generate", fake.generate)
+    monkeypatch.setattr("beacon.materials.resume.generate_structured", fake.generate_structured)
+    return fake
 
 
 class TestSelectRelevantItems:
-    def test_selects_relevant_skills(self, db):
-        _populate_profile(db)
-        requirements = {
-            "required_skills": ["Python", "SQL", "Spark"],
-            "preferred_skills": ["dbt"],
-            "keywords": ["data engineering"],
-        }
-        result = select_relevant_items(db, requirements)
+    def test_selects_relevant_skills(self, select_populated):
+        result = select_populated(("Python", "SQL", "Spark"), ("dbt",), ("data engineering",))
         skill_names = [s["name"] for s in result["skills"]]
         assert "Python" in skill_names
         assert "SQL" in skill_names
         assert "Spark" in skill_names
 
-    def test_includes_all_work_experiences(self, db):
-        _populate_profile(db)
-        requirements = {"required_skills": ["Python"], "preferred_skills": [], "keywords": []}
-        result = select_relevant_items(db, requirements)
+    def test_includes_all_work_experiences(self, select_populated):
+        result = select_populated(("Python",))
         assert len(result["work_experiences"]) == 2
 
-    def test_sorts_work_by_relevance(self, db):
-        _populate_profile(db)
-        requirements = {
-            "required_skills": ["Spark", "dbt"],
-            "preferred_skills": [],
-            "keywords": [],
-        }
-        result = select_relevant_items(db, requirements)
+    def test_sorts_work_by_relevance(self, select_populated):
+        result = select_populated(("Spark", "dbt"))
         # DataCo has Spark and dbt, should be first
         assert result["work_experiences"][0]["company"] == "DataCo"
 
     def test_limits_projects(self, db):
-        for i in range(10):
-            add_project(db, f"Project {i}")
+        db.executemany("INSERT INTO projects (name) VALUES (?)", [(f"Project {i}",) for i in range(10)])
         requirements = {"required_skills": [], "preferred_skills": [], "keywords": []}
         result = select_relevant_items(db, requirements)
         assert len(result["projects"]) <= 5
@@ -105,40 +92,28 @@ class TestSelectRelevantItems:
 
 
 class TestFormatProfile:
-    def test_formats_work_experience(self, db):
-        _populate_profile(db)
-        requirements = {"required_skills": ["Python"], "preferred_skills": [], "keywords": []}
-        profile_data = select_relevant_items(db, requirements)
-        text = _format_profile_for_prompt(profile_data)
+    def test_formats_work_experience(self, select_populated):
+        text = _format_profile_for_prompt(select_populated(("Python",)))
         assert "DataCo" in text
         assert "Senior Data Engineer" in text
         assert "Python" in text
 
-    def test_formats_skills(self, db):
-        _populate_profile(db)
-        requirements = {"required_skills": ["Python"], "preferred_skills": [], "keywords": []}
-        profile_data = select_relevant_items(db, requirements)
-        text = _format_profile_for_prompt(profile_data)
+    def test_formats_skills(self, select_populated):
+        text = _format_profile_for_prompt(select_populated(("Python",)))
         assert "## Skills" in text
 
-    def test_formats_education(self, db):
-        _populate_profile(db)
-        requirements = {"required_skills": [], "preferred_skills": [], "keywords": []}
-        profile_data = select_relevant_items(db, requirements)
-        text = _format_profile_for_prompt(profile_data)
+    def test_formats_education(self, select_populated):
+        text = _format_profile_for_prompt(select_populated())
         assert "State University" in text
 
 
 class TestTailorResume:
-    @patch("beacon.materials.resume.generate")
-    @patch("beacon.materials.resume.generate_structured")
-    def test_tailor_resume_pipeline(self, mock_structured, mock_generate, db):
-        cid = _insert_company(db)
-        job = upsert_job(db, cid, "Data Engineer", url="https://x.com/1",
+    def test_tailor_resume_pipeline(self, fake_llm, populated_db, insert_company):
+        cid = insert_company(populated_db)
+        job = upsert_job(populated_db, cid, "Data Engineer", url="https://x.com/1",
                          description_text="Looking for Python, SQL, Spark expert")
-        _populate_profile(db)
 
-        mock_structured.return_value = {
+        fake_llm.requirements = {
             "required_skills": ["Python", "SQL", "Spark"],
             "preferred_skills": ["dbt"],
             "seniority": "senior",
@@ -146,107 +121,82 @@ class TestTailorResume:
             "responsibilities": ["Build data pipelines"],
             "culture_signals": [],
         }
-        mock_generate.return_value = LLMResponse(
+        fake_llm.response = LLMResponse(
             text="# Resume\n## Summary\nExperienced data engineer...",
             model="claude-sonnet-4-5-20250929",
             input_tokens=100,
             output_tokens=200,
         )
 
-        result = tailor_resume(db, job["id"])
+        result = tailor_resume(populated_db, job["id"])
         assert isinstance(result, TailoredResume)
         assert result.job_title == "Data Engineer"
         assert result.company_name == "TestCo"
         assert "Resume" in result.markdown
         assert result.requirements["required_skills"] == ["Python", "SQL", "Spark"]
 
-    @patch("beacon.materials.resume.generate")
-    @patch("beacon.materials.resume.generate_structured")
-    def test_tailor_resume_uses_title_when_no_description(self, mock_structured, mock_generate, db):
-        cid = _insert_company(db)
-        job = upsert_job(db, cid, "ML Engineer", url="https://x.com/1")
-        _populate_profile(db)
+    def test_tailor_resume_uses_title_when_no_description(self, fake_llm, populated_db, insert_company):
+        cid = insert_company(populated_db)
+        job = upsert_job(populated_db, cid, "ML Engineer", url="https://x.com/1")
 
-        mock_structured.return_value = {
+        fake_llm.requirements = {
             "required_skills": ["Python"], "preferred_skills": [],
             "seniority": "senior", "keywords": [], "responsibilities": [], "culture_signals": [],
         }
-        mock_generate.return_value = LLMResponse(
-            text="# Resume", model="test", input_tokens=10, output_tokens=20,
-        )
 
-        tailor_resume(db, job["id"])
+        tailor_resume(populated_db, job["id"])
         # Should have used the title "ML Engineer" as the description
-        call_args = mock_structured.call_args[0][0]
-        assert "ML Engineer" in call_args
+        assert "ML Engineer" in fake_llm.structured_prompts[0]
 
     def test_tailor_resume_job_not_found(self, db):
         with pytest.raises(ValueError, match="not found"):
             tailor_resume(db, 99999)
 
-    @patch("beacon.materials.resume.generate")
-    @patch("beacon.materials.resume.generate_structured")
-    def test_prompt_includes_archetype_positioning(self, mock_structured, mock_generate, db):
+    def test_prompt_includes_archetype_positioning(self, fake_llm, populated_db, insert_company):
         from beacon.research.archetypes import archetype_label, framing_for
 
-        cid = _insert_company(db)
-        job = upsert_job(db, cid, "Data Engineer", url="https://x.com/1",
+        cid = insert_company(populated_db)
+        job = upsert_job(populated_db, cid, "Data Engineer", url="https://x.com/1",
                          description_text="dbt and warehouse modeling",
                          archetype="data_platform", archetype_confidence=0.9)
-        _populate_profile(db)
 
-        mock_structured.return_value = {
+        fake_llm.requirements = {
             "required_skills": ["Python"], "preferred_skills": [],
             "seniority": "senior", "keywords": [], "responsibilities": [], "culture_signals": [],
         }
-        mock_generate.return_value = LLMResponse(
-            text="# Resume", model="test", input_tokens=10, output_tokens=20,
-        )
 
-        tailor_resume(db, job["id"])
-        prompt = mock_generate.call_args[0][0]
+        tailor_resume(populated_db, job["id"])
+        prompt = fake_llm.prompts[0]
         assert archetype_label("data_platform") in prompt
         assert framing_for("data_platform") in prompt
 
-    @patch("beacon.materials.resume.generate")
-    @patch("beacon.materials.resume.generate_structured")
-    def test_prompt_positioning_falls_back_to_classifier(self, mock_structured, mock_generate, db):
+    def test_prompt_positioning_falls_back_to_classifier(self, fake_llm, populated_db, insert_company):
         from beacon.research.archetypes import framing_for
 
-        cid = _insert_company(db)
+        cid = insert_company(populated_db)
         # No stored archetype — the title alone should classify on the fly
-        job = upsert_job(db, cid, "Forward Deployed Engineer", url="https://x.com/1")
-        _populate_profile(db)
+        job = upsert_job(populated_db, cid, "Forward Deployed Engineer", url="https://x.com/1")
 
-        mock_structured.return_value = {
+        fake_llm.requirements = {
             "required_skills": [], "preferred_skills": [],
             "seniority": "senior", "keywords": [], "responsibilities": [], "culture_signals": [],
         }
-        mock_generate.return_value = LLMResponse(
-            text="# Resume", model="test", input_tokens=10, output_tokens=20,
-        )
 
-        tailor_resume(db, job["id"])
-        prompt = mock_generate.call_args[0][0]
+        tailor_resume(populated_db, job["id"])
+        prompt = fake_llm.prompts[0]
         assert framing_for("solutions_fde") in prompt
 
-    @patch("beacon.materials.resume.generate")
-    @patch("beacon.materials.resume.generate_structured")
-    def test_prompt_builds_without_archetype(self, mock_structured, mock_generate, db):
-        cid = _insert_company(db)
-        job = upsert_job(db, cid, "Office Manager", url="https://x.com/1")
-        _populate_profile(db)
+    def test_prompt_builds_without_archetype(self, fake_llm, populated_db, insert_company):
+        cid = insert_company(populated_db)
+        job = upsert_job(populated_db, cid, "Office Manager", url="https://x.com/1")
 
-        mock_structured.return_value = {
+        fake_llm.requirements = {
             "required_skills": [], "preferred_skills": [],
             "seniority": "mid", "keywords": [], "responsibilities": [], "culture_signals": [],
         }
-        mock_generate.return_value = LLMResponse(
-            text="# Resume", model="test", input_tokens=10, output_tokens=20,
-        )
 
-        tailor_resume(db, job["id"])
-        prompt = mock_generate.call_args[0][0]
+        tailor_resume(populated_db, job["id"])
+        prompt = fake_llm.prompts[0]
         assert "Role Positioning" not in prompt
         assert "{positioning}" not in prompt
 
@@ -1,33 +1,39 @@
 """Tests for the scanner orchestrator."""
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
 
 import pytest
 
-from beacon.db.connection import get_connection, init_db
 from beacon.scanner import ScanResult, scan_all, scan_company
 
 
-@pytest.fixture
-def db(tmp_path):
-    db_path = tmp_path / "test_beacon.db"
-    init_db(db_path)
-    conn = get_connection(db_path)
-    yield conn
-    conn.close()
+def _insert_company(conn, name="TestCo", platform="greenhouse", domain="testco.com"):
+    return conn.execute(
+        "INSERT INTO companies (name, domain, careers_platform, careers_url, remote_policy, size_bucket) "
+        "VALUES (?, ?, ?, ?, 'hybrid', 'mid-200-1000') RETURNING *",
+        (name, domain, platform, f"https://{domain}/careers"),
+    ).fetchone()
 
 
-def _insert_company(conn, name="TestCo", platform="greenhouse", domain="testco.com"):
-    conn.execute(
+def _insert_companies_bulk(conn, rows, platform="greenhouse"):
+    """Insert ``(name, domain)`` or ``(name, domain, platform)`` rows in one executemany; return the rows."""
+    params = [
+        (name, domain, rest[0] if rest else platform, f"https://{domain}/careers")
+        for name, domain, *rest in rows
+    ]
+    conn.executemany(
         "INSERT INTO companies (name, domain, careers_platform, careers_url, remote_policy, size_bucket) "
         "VALUES (?, ?, ?, ?, 'hybrid', 'mid-200-1000')",
-        (name, domain, platform, f"https://{domain}/careers"),
+        params,
     )
-    conn.commit()
-    return conn.execute("SELECT * FROM companies WHERE name = ?", (name,)).fetchone()
+    names = [p[0] for p in params]
+    placeholders = ", ".join("?" * len(names))
+    return conn.execute(f"SELECT * FROM companies WHERE name IN ({placeholders})", names).fetchall()
 
 
-MOCK_JOBS = [
+# Read-only job dicts shared by every test: scan_company must not mutate adapter
+# output, and a stray write fails loudly instead of leaking into the next test.
+MOCK_JOBS = tuple(MappingProxyType(job) for job in (
     {
         "title": "Senior Data Engineer",
         "url": "https://testco.com/jobs/1",
@@ -44,16 +50,34 @@ MOCK_JOBS = [
         "description_text": "Manage the office.",
         "date_posted": "2025-03-01",
     },
-]
+))
+
+
+@pytest.fixture
+def adapter_registry(monkeypatch):
+    """Platform -> adapter mapping that ``beacon.scanner.get_adapter`` resolves against."""
+    registry = {}
+    monkeypatch.setattr("beacon.scanner.get_adapter", registry.get)
+    return registry
+
+
+class _StubAdapter:
+    """Adapter stand-in whose ``fetch_jobs`` returns ``jobs`` or raises ``raise_exc``."""
+
+    def __init__(self, jobs=(), raise_exc=None):
+        self.jobs = jobs
+        self.raise_exc = raise_exc
+
+    def fetch_jobs(self, company):
+        if self.raise_exc is not None:
+            raise self.raise_exc
+        return self.jobs
 
 
 class TestScanCompany:
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_with_mocked_adapter(self, mock_get_adapter, db):
+    def test_scan_with_mocked_adapter(self, adapter_registry, db):
         company = _insert_company(db)
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.return_value = MOCK_JOBS
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter(MOCK_JOBS)
 
         result = scan_company(db, company)
         assert isinstance(result, ScanResult)
@@ -62,54 +86,46 @@ class TestScanCompany:
         assert result.error is None
 
         # Verify jobs in DB
-        jobs = db.execute("SELECT * FROM job_listings ORDER BY relevance_score DESC").fetchall()
-        assert len(jobs) == 2
-        assert jobs[0]["relevance_score"] > jobs[1]["relevance_score"]
+        row = db.execute(
+            "SELECT COUNT(*) AS n, MAX(relevance_score) AS hi, MIN(relevance_score) AS lo FROM job_listings"
+        ).fetchone()
+        assert row["n"] == 2
+        assert row["hi"] > row["lo"]
 
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_unknown_platform(self, mock_get_adapter, db):
+    def test_scan_unknown_platform(self, adapter_registry, db):
         company = _insert_company(db, platform="workday")
-        mock_get_adapter.return_value = None
 
         result = scan_company(db, company)
         assert result.error is not None
         assert "No adapter" in result.error
 
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_http_error(self, mock_get_adapter, db):
+    def test_scan_http_error(self, adapter_registry, db):
         company = _insert_company(db)
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.side_effect = Exception("Connection timeout")
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter(raise_exc=Exception("Connection timeout"))
 
         result = scan_company(db, company)
         assert result.error == "Connection timeout"
         assert result.jobs_found == 0
 
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_marks_stale_jobs(self, mock_get_adapter, db):
+    def test_scan_marks_stale_jobs(self, adapter_registry, db):
         company = _insert_company(db)
-        mock_adapter = MagicMock()
-        mock_get_adapter.return_value = mock_adapter
+        adapter = _StubAdapter(MOCK_JOBS)
+        adapter_registry["greenhouse"] = adapter
 
         # First scan: two jobs
-        mock_adapter.fetch_jobs.return_value = MOCK_JOBS
         scan_company(db, company)
 
         # Second scan: only one job
-        mock_adapter.fetch_jobs.return_value = [MOCK_JOBS[0]]
+        adapter.jobs = MOCK_JOBS[:1]
         result = scan_company(db, company)
         assert result.stale_jobs == 1
 
-        closed = db.execute("SELECT COUNT(*) as cnt FROM job_listings WHERE status = 'closed'").fetchone()["cnt"]
+        closed = db.execute("SELECT COUNT(*) FROM job_listings WHERE status = 'closed'").fetchone()[0]
         assert closed == 1
 
-    @patch("beacon.scanner.get_adapter")
-    def test_rescan_updates_existing(self, mock_get_adapter, db):
+    def test_rescan_updates_existing(self, adapter_registry, db):
         company = _insert_company(db)
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.return_value = MOCK_JOBS
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter(MOCK_JOBS)
 
         r1 = scan_company(db, company)
         assert r1.new_jobs == 2
@@ -118,12 +134,9 @@ class TestScanCompany:
         assert r2.new_jobs == 0
         assert r2.updated_jobs == 2
 
-    @patch("beacon.scanner.get_adapter")
-    def test_empty_scan(self, mock_get_adapter, db):
+    def test_empty_scan(self, adapter_registry, db):
         company = _insert_company(db)
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.return_value = []
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter()
 
         result = scan_company(db, company)
         assert result.jobs_found == 0
@@ -131,26 +144,19 @@ class TestScanCompany:
 
 
 class TestScanAll:
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_all_companies(self, mock_get_adapter, db):
-        _insert_company(db, "CompanyA", domain="a.com")
-        _insert_company(db, "CompanyB", domain="b.com")
+    def test_scan_all_companies(self, adapter_registry, db):
+        companies = _insert_companies_bulk(db, [("CompanyA", "a.com"), ("CompanyB", "b.com")])
 
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.return_value = MOCK_JOBS
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter(MOCK_JOBS)
 
         results = scan_all(db)
         assert len(results) == 2
+        assert {r.company_name for r in results} == {c["name"] for c in companies}
 
-    @patch("beacon.scanner.get_adapter")
-    def test_scan_all_filters_by_platform(self, mock_get_adapter, db):
-        _insert_company(db, "GH Co", platform="greenhouse", domain="gh.com")
-        _insert_company(db, "Custom Co", platform="custom", domain="custom.com")
+    def test_scan_all_filters_by_platform(self, adapter_registry, db):
+        _insert_companies_bulk(db, [("GH Co", "gh.com", "greenhouse"), ("Custom Co", "custom.com", "custom")])
 
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_jobs.return_value = []
-        mock_get_adapter.return_value = mock_adapter
+        adapter_registry["greenhouse"] = _StubAdapter()
 
         results = scan_all(db, platform="greenhouse")
         assert len(results) == 1
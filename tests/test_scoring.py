@@ -3,7 +3,7 @@
 
 import pytest
 
-from beacon.db.connection import get_connection, init_db, reset_db
+from beacon.db.connection import get_connection, init_schema, reset_db
 from beacon.db.seed import seed_database
 from beacon.research.scoring import (
     WEIGHTS,
@@ -17,30 +17,58 @@ from beacon.research.scoring import (
 )
 
 
-@pytest.fixture
-def db(tmp_path):
-    """Create a fresh test database."""
-    db_path = tmp_path / "test_beacon.db"
-    init_db(db_path)
-    conn = get_connection(db_path)
+@pytest.fixture(scope="module")
+def _seeded_template():
+    """Seed data loaded once per module; tests only ever read from clones."""
+    conn = get_connection(":memory:")
+    init_schema(conn)
+    seed_database(conn)
     yield conn
     conn.close()
 
 
 @pytest.fixture
-def seeded_db(db):
-    """Database with seed data loaded."""
-    seed_database(db)
-    return db
+def seeded_db(_seeded_template):
+    """Private copy of the seeded database, cloned page-by-page via the backup API."""
+    conn = get_connection(":memory:")
+    _seeded_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+_INSERT_LEADERSHIP = (
+    "INSERT INTO leadership_signals (company_id, leader_name, content, impact_level) VALUES (?, ?, ?, ?)"
+)
+_INSERT_TOOL = "INSERT INTO tools_adopted (company_id, tool_name, adoption_level) VALUES (?, ?, ?)"
+_INSERT_SIGNAL = "INSERT INTO ai_signals (company_id, signal_type, title, signal_strength) VALUES (?, ?, ?, ?)"
+_INSERT_RECENT_SIGNAL = (
+    "INSERT INTO ai_signals (company_id, signal_type, title, signal_strength, date_observed) "
+    "VALUES (?, ?, ?, ?, date('now'))"
+)
 
 
 def _insert_company(conn, name="TestCo", tier=3):
-    conn.execute(
+    return conn.execute(
         "INSERT INTO companies (name, tier, remote_policy, size_bucket) VALUES (?, ?, 'hybrid', 'mid-200-1000')",
         (name, tier),
-    )
-    conn.commit()
-    return conn.execute("SELECT id FROM companies WHERE name = ?", (name,)).fetchone()["id"]
+    ).lastrowid
+
+
+def _signal_counts_by_tier(conn, tier):
+    """Rows of (id, name, total) with each tier company's signal count across all three tables."""
+    # COUNT(s.company_id), not COUNT(*): a company with no signals must count 0, not 1.
+    return conn.execute(
+        """SELECT c.id, c.name, COUNT(s.company_id) AS total
+           FROM companies c
+           LEFT JOIN (
+               SELECT company_id FROM ai_signals
+               UNION ALL SELECT company_id FROM leadership_signals
+               UNION ALL SELECT company_id FROM tools_adopted
+           ) s ON s.company_id = c.id
+           WHERE c.tier = ?
+           GROUP BY c.id""",
+        (tier,),
+    ).fetchall()
 
 
 class TestDatabaseInit:
@@ -55,46 +83,37 @@ class TestDatabaseInit:
         assert "tools_adopted" in table_names
         assert "score_breakdown" in table_names
 
-    def test_foreign_keys_enabled(self, db):
-        fk = db.execute("PRAGMA foreign_keys").fetchone()
+    def test_foreign_keys_enabled(self):
+        conn = get_connection(":memory:")
+        fk = conn.execute("PRAGMA foreign_keys").fetchone()
+        conn.close()
         assert fk[0] == 1
 
+    def test_init_schema_on_memory_connection(self):
+        conn = get_connection(":memory:")
+        init_schema(conn)
+        tables = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        assert {"companies", "job_listings", "role_targets", "job_requirements"} <= tables
+
 
 class TestSeeding:
     def test_seed_creates_companies(self, seeded_db):
-        count = seeded_db.execute("SELECT COUNT(*) as cnt FROM companies").fetchone()["cnt"]
+        count = seeded_db.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
         assert count >= 30
 
     def test_seed_creates_signals(self, seeded_db):
-        signals = seeded_db.execute("SELECT COUNT(*) as cnt FROM ai_signals").fetchone()["cnt"]
-        leadership = seeded_db.execute("SELECT COUNT(*) as cnt FROM leadership_signals").fetchone()["cnt"]
-        tools = seeded_db.execute("SELECT COUNT(*) as cnt FROM tools_adopted").fetchone()["cnt"]
+        signals = seeded_db.execute("SELECT COUNT(*) FROM ai_signals").fetchone()[0]
+        leadership = seeded_db.execute("SELECT COUNT(*) FROM leadership_signals").fetchone()[0]
+        tools = seeded_db.execute("SELECT COUNT(*) FROM tools_adopted").fetchone()[0]
         total = signals + leadership + tools
         assert total >= 100
 
-    def test_tier1_companies_have_signals(self, seeded_db):
-        """Every Tier 1 company should have at least 2 signals."""
-        companies = seeded_db.execute("SELECT id, name FROM companies WHERE tier = 1").fetchall()
-        for c in companies:
-            total = 0
-            for table in ["ai_signals", "leadership_signals", "tools_adopted"]:
-                row = seeded_db.execute(
-                    f"SELECT COUNT(*) as cnt FROM {table} WHERE company_id = ?", (c["id"],)
-                ).fetchone()
-                total += row["cnt"]
-            assert total >= 2, f"{c['name']} (Tier 1) has only {total} signals"
-
-    def test_tier2_companies_have_signals(self, seeded_db):
-        """Every Tier 2 company should have at least 2 signals."""
-        companies = seeded_db.execute("SELECT id, name FROM companies WHERE tier = 2").fetchall()
-        for c in companies:
-            total = 0
-            for table in ["ai_signals", "leadership_signals", "tools_adopted"]:
-                row = seeded_db.execute(
-                    f"SELECT COUNT(*) as cnt FROM {table} WHERE company_id = ?", (c["id"],)
-                ).fetchone()
-                total += row["cnt"]
-            assert total >= 2, f"{c['name']} (Tier 2) has only {total} signals"
+    @pytest.mark.parametrize("tier", [1, 2])
+    def test_tier_companies_have_signals(self, seeded_db, tier):
+        """Every Tier 1 and Tier 2 company should have at least 2 signals."""
+        for c in _signal_counts_by_tier(seeded_db, tier):
+            assert c["total"] >= 2, f"{c['name']} (Tier {tier}) has only {c['total']} signals"
 
     def test_all_companies_have_scores(self, seeded_db):
         rows = seeded_db.execute(
@@ -105,9 +124,9 @@ class TestSeeding:
 
     def test_seed_is_idempotent(self, seeded_db):
         """Seeding twice shouldn't duplicate data."""
-        count_before = seeded_db.execute("SELECT COUNT(*) as cnt FROM companies").fetchone()["cnt"]
+        count_before = seeded_db.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
         seed_database(seeded_db)
-        count_after = seeded_db.execute("SELECT COUNT(*) as cnt FROM companies").fetchone()["cnt"]
+        count_after = seeded_db.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
         assert count_after == count_before
 
 
@@ -122,10 +141,7 @@ class TestScoring:
 
     def test_leadership_score_company_wide(self, db):
         cid = _insert_company(db)
-        db.execute(
-            "INSERT INTO leadership_signals (company_id, leader_name, content, impact_level) VALUES (?, 'CEO', 'AI first', 'company-wide')",
-            (cid,),
-        )
+        db.execute(_INSERT_LEADERSHIP, (cid, "CEO", "AI first", "company-wide"))
         db.commit()
         score = compute_leadership_score(db, cid)
         assert score == 10.0
@@ -136,48 +152,43 @@ class TestScoring:
 
     def test_tool_adoption_score_required(self, db):
         cid = _insert_company(db)
-        db.execute(
-            "INSERT INTO tools_adopted (company_id, tool_name, adoption_level) VALUES (?, 'Claude', 'required')",
-            (cid,),
-        )
+        db.execute(_INSERT_TOOL, (cid, "Claude", "required"))
         db.commit()
         score = compute_tool_adoption_score(db, cid)
         assert score == 10.0
 
     def test_tool_diversity_bonus(self, db):
         cid = _insert_company(db)
-        db.execute("INSERT INTO tools_adopted (company_id, tool_name, adoption_level) VALUES (?, 'Claude', 'encouraged')", (cid,))
-        db.execute("INSERT INTO tools_adopted (company_id, tool_name, adoption_level) VALUES (?, 'Copilot', 'encouraged')", (cid,))
-        db.commit()
+        with db:
+            db.executemany(
+                _INSERT_TOOL,
+                [(cid, "Claude", "encouraged"), (cid, "Copilot", "encouraged")],
+            )
         score = compute_tool_adoption_score(db, cid)
         assert score > 8.0  # base 8 + diversity bonus
 
     def test_evidence_depth_logarithmic(self, db):
         cid = _insert_company(db)
-        for i in range(15):
-            db.execute(
-                "INSERT INTO ai_signals (company_id, signal_type, title, signal_strength) VALUES (?, 'press_coverage', ?, 3)",
-                (cid, f"Signal {i}"),
+        with db:
+            db.executemany(
+                _INSERT_SIGNAL,
+                ((cid, "press_coverage", f"Signal {i}", 3) for i in range(15)),
             )
-        db.commit()
         score = compute_evidence_depth_score(db, cid)
         assert 7.0 < score <= 10.0
 
     def test_recency_recent_scores_high(self, db):
         cid = _insert_company(db)
-        db.execute(
-            "INSERT INTO ai_signals (company_id, signal_type, title, signal_strength, date_observed) VALUES (?, 'press_coverage', 'Recent', 3, date('now'))",
-            (cid,),
-        )
+        db.execute(_INSERT_RECENT_SIGNAL, (cid, "press_coverage", "Recent", 3))
         db.commit()
         score = compute_recency_score(db, cid)
         assert score >= 9.0
 
     def test_composite_score_computed(self, db):
         cid = _insert_company(db)
-        db.execute("INSERT INTO leadership_signals (company_id, leader_name, content, impact_level) VALUES (?, 'CEO', 'AI mandate', 'company-wide')", (cid,))
-        db.execute("INSERT INTO tools_adopted (company_id, tool_name, adoption_level) VALUES (?, 'Claude', 'required')", (cid,))
-        db.execute("INSERT INTO ai_signals (company_id, signal_type, title, signal_strength, date_observed) VALUES (?, 'company_policy', 'AI policy', 5, date('now'))", (cid,))
+        db.execute(_INSERT_LEADERSHIP, (cid, "CEO", "AI mandate", "company-wide"))
+        db.execute(_INSERT_TOOL, (cid, "Claude", "required"))
+        db.execute(_INSERT_RECENT_SIGNAL, (cid, "company_policy", "AI policy", 5))
         db.commit()
         scores = compute_composite_score(db, cid)
         assert scores["composite_score"] > 0
@@ -186,37 +197,46 @@ class TestScoring:
 
     def test_refresh_score_updates_company(self, db):
         cid = _insert_company(db)
-        db.execute("INSERT INTO leadership_signals (company_id, leader_name, content, impact_level) VALUES (?, 'CEO', 'AI', 'company-wide')", (cid,))
+        db.execute(_INSERT_LEADERSHIP, (cid, "CEO", "AI", "company-wide"))
         db.commit()
         composite = refresh_score(db, cid)
         assert composite > 0
         row = db.execute("SELECT ai_first_score FROM companies WHERE id = ?", (cid,)).fetchone()
-        assert row["ai_first_score"] == composite
+        assert row[0] == composite
 
     def test_refresh_all_scores(self, seeded_db):
         count = refresh_all_scores(seeded_db)
         assert count >= 30
 
+    def test_refresh_all_matches_refresh_score(self, seeded_db):
+        refresh_all_scores(seeded_db)
+        cid, stored = seeded_db.execute("SELECT id, ai_first_score FROM companies ORDER BY id LIMIT 1").fetchone()
+        assert stored == refresh_score(seeded_db, cid)
+        mismatched = seeded_db.execute(
+            "SELECT COUNT(*) FROM companies c JOIN score_breakdown s ON s.company_id = c.id "
+            "WHERE c.ai_first_score != s.composite_score"
+        ).fetchone()[0]
+        assert mismatched == 0
+
     def test_tier1_scores_higher_than_tier4(self, seeded_db):
         tier1_avg = seeded_db.execute(
-            "SELECT AVG(ai_first_score) as avg FROM companies WHERE tier = 1"
-        ).fetchone()["avg"]
+            "SELECT AVG(ai_first_score) FROM companies WHERE tier = 1"
+        ).fetchone()[0]
         tier4_avg = seeded_db.execute(
-            "SELECT AVG(ai_first_score) as avg FROM companies WHERE tier = 4"
-        ).fetchone()["avg"]
+            "SELECT AVG(ai_first_score) FROM companies WHERE tier = 4"
+        ).fetchone()[0]
         assert tier1_avg > tier4_avg
 
 
 class TestResetDb:
     def test_reset_clears_and_reinitializes(self, tmp_path):
         db_path = tmp_path / "test_reset.db"
-        init_db(db_path)
         conn = get_connection(db_path)
+        init_schema(conn)
         conn.execute("INSERT INTO companies (name, remote_policy, size_bucket) VALUES ('Test', 'hybrid', 'mid-200-1000')")
         conn.commit()
-        conn.close()
+        # reset_db works through its own connection; this one sees the rebuilt schema.
         reset_db(db_path)
-        conn = get_connection(db_path)
-        count = conn.execute("SELECT COUNT(*) as cnt FROM companies").fetchone()["cnt"]
+        count = conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
         conn.close()
         assert count == 0
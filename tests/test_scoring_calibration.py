@@ -5,7 +5,6 @@ from unittest.mock import patch
 import pytest
 from typer.testing import CliRunner
 
-from beacon.db.connection import get_connection, init_db
 from beacon.db.feedback import record_outcome, record_resume_variant
 from beacon.materials.variant_tracker import (
     analyze_variant_performance,
@@ -20,62 +19,75 @@ from beacon.research.scoring_calibration import (
 runner = CliRunner()
 
 
-@pytest.fixture
-def db(tmp_path):
-    db_path = tmp_path / "test_beacon.db"
-    init_db(db_path)
-    conn = get_connection(db_path)
-    yield conn, db_path
-    conn.close()
-
-
 def _insert_company(conn, name="TestCo"):
-    cursor = conn.execute(
+    return conn.execute(
         "INSERT INTO companies (name, careers_platform, domain) VALUES (?, 'greenhouse', 'testco.com')",
         (name,),
-    )
-    conn.commit()
-    return cursor.lastrowid
+    ).lastrowid
 
 
 def _insert_job(conn, company_id, title="Data Engineer", score=8.0):
-    cursor = conn.execute(
+    return conn.execute(
         "INSERT INTO job_listings (company_id, title, relevance_score, status) VALUES (?, ?, ?, 'active')",
         (company_id, title, score),
-    )
-    conn.commit()
-    return cursor.lastrowid
+    ).lastrowid
 
 
 def _insert_application(conn, job_id, status="applied"):
-    cursor = conn.execute(
+    return conn.execute(
         "INSERT INTO applications (job_id, status, applied_date) VALUES (?, ?, '2026-01-01')",
         (job_id, status),
-    )
-    conn.commit()
-    return cursor.lastrowid
+    ).lastrowid
+
+
+def _bulk_setup(conn, company_id, specs):
+    """Insert one job, application, resume variant and outcome per ``(title, variant, outcome)`` spec.
+
+    Each table gets a single executemany inside one transaction; later rows
+    find their parent ids by joining back on the (unique) job title.
+    """
+    with conn:
+        conn.executemany(
+            "INSERT INTO job_listings (company_id, title, relevance_score, status) VALUES (?, ?, 8.0, 'active')",
+            [(company_id, title) for title, _, _ in specs],
+        )
+        conn.executemany(
+            "INSERT INTO applications (job_id, status, applied_date) "
+            "SELECT id, 'applied', '2026-01-01' FROM job_listings WHERE company_id = ? AND title = ?",
+            [(company_id, title) for title, _, _ in specs],
+        )
+        conn.executemany(
+            "INSERT INTO resume_variants (application_id, variant_label) "
+            "SELECT a.id, ? FROM applications a JOIN job_listings j ON a.job_id = j.id "
+            "WHERE j.company_id = ? AND j.title = ?",
+            [(variant, company_id, title) for title, variant, _ in specs],
+        )
+        conn.executemany(
+            "INSERT INTO application_outcomes (application_id, outcome) "
+            "SELECT a.id, ? FROM applications a JOIN job_listings j ON a.job_id = j.id "
+            "WHERE j.company_id = ? AND j.title = ?",
+            [(outcome, company_id, title) for title, _, outcome in specs],
+        )
 
 
 # --- Scoring Calibration ---
 
 class TestComputeCalibration:
     def test_no_data(self, db):
-        conn, _ = db
-        result = compute_calibration_adjustments(conn)
+        result = compute_calibration_adjustments(db)
         assert result["has_data"] is False
         assert "No outcome data" in result["message"]
 
     def test_with_outcomes(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid1 = _insert_job(conn, cid, "Job A", score=9.0)
-        jid2 = _insert_job(conn, cid, "Job B", score=5.0)
-        aid1 = _insert_application(conn, jid1)
-        aid2 = _insert_application(conn, jid2)
-        record_outcome(conn, aid1, "phone_screen", response_days=5)
-        record_outcome(conn, aid2, "rejection_auto", response_days=1)
-
-        result = compute_calibration_adjustments(conn)
+        cid = _insert_company(db)
+        jid1 = _insert_job(db, cid, "Job A", score=9.0)
+        jid2 = _insert_job(db, cid, "Job B", score=5.0)
+        aid1 = _insert_application(db, jid1)
+        aid2 = _insert_application(db, jid2)
+        record_outcome(db, aid1, "phone_screen", response_days=5)
+        record_outcome(db, aid2, "rejection_auto", response_days=1)
+
+        result = compute_calibration_adjustments(db)
         assert result["has_data"] is True
         assert result["total_outcomes"] == 2
         assert result["positive_count"] == 1
@@ -84,60 +96,55 @@ class TestComputeCalibration:
         assert result["negative_avg_score"] == 5.0
 
     def test_by_outcome_type(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid = _insert_job(conn, cid, score=8.0)
-        aid = _insert_application(conn, jid)
-        record_outcome(conn, aid, "phone_screen")
-        record_outcome(conn, aid, "phone_screen")
-        record_outcome(conn, aid, "technical")
-
-        result = compute_calibration_adjustments(conn)
+        cid = _insert_company(db)
+        jid = _insert_job(db, cid, score=8.0)
+        aid = _insert_application(db, jid)
+        record_outcome(db, aid, "phone_screen")
+        record_outcome(db, aid, "phone_screen")
+        record_outcome(db, aid, "technical")
+
+        result = compute_calibration_adjustments(db)
         assert "phone_screen" in result["by_outcome"]
         assert result["by_outcome"]["phone_screen"]["count"] == 2
         assert "technical" in result["by_outcome"]
 
     def test_suggestions_few_data(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid = _insert_job(conn, cid, score=8.0)
-        aid = _insert_application(conn, jid)
-        record_outcome(conn, aid, "phone_screen")
+        cid = _insert_company(db)
+        jid = _insert_job(db, cid, score=8.0)
+        aid = _insert_application(db, jid)
+        record_outcome(db, aid, "phone_screen")
 
-        result = compute_calibration_adjustments(conn)
+        result = compute_calibration_adjustments(db)
         assert any("10+" in s for s in result["suggestions"])
 
     def test_suggestions_low_positive_score(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
+        cid = _insert_company(db)
         # Low-scored job gets positive outcome
-        jid = _insert_job(conn, cid, "Low Scored", score=3.0)
-        aid = _insert_application(conn, jid)
-        record_outcome(conn, aid, "phone_screen")
+        jid = _insert_job(db, cid, "Low Scored", score=3.0)
+        aid = _insert_application(db, jid)
+        record_outcome(db, aid, "phone_screen")
         # Need a negative for comparison
-        jid2 = _insert_job(conn, cid, "Another", score=4.0)
-        aid2 = _insert_application(conn, jid2)
-        record_outcome(conn, aid2, "rejection_auto")
+        jid2 = _insert_job(db, cid, "Another", score=4.0)
+        aid2 = _insert_application(db, jid2)
+        record_outcome(db, aid2, "rejection_auto")
 
-        result = compute_calibration_adjustments(conn)
+        result = compute_calibration_adjustments(db)
         assert any("undervaluing" in s for s in result["suggestions"])
 
 
 class TestScoringReport:
     def test_report_no_data(self, db):
-        conn, _ = db
-        report = generate_scoring_report(conn)
+        report = generate_scoring_report(db)
         assert "Scoring Calibration Report" in report
         assert "No outcome data" in report
 
     def test_report_with_data(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid = _insert_job(conn, cid, score=8.0)
-        aid = _insert_application(conn, jid)
-        record_outcome(conn, aid, "phone_screen", response_days=5)
+        cid = _insert_company(db)
+        jid = _insert_job(db, cid, score=8.0)
+        aid = _insert_application(db, jid)
+        record_outcome(db, aid, "phone_screen", response_days=5)
 
-        report = generate_scoring_report(conn)
+        report = generate_scoring_report(db)
         assert "Summary" in report
         assert "phone_screen" in report
         assert "Suggestions" in report
@@ -147,106 +154,95 @@ class TestScoringReport:
 
 class TestVariantPerformance:
     def test_no_data(self, db):
-        conn, _ = db
-        result = analyze_variant_performance(conn)
+        result = analyze_variant_performance(db)
         assert result["has_data"] is False
 
     def test_with_variants(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid1 = _insert_job(conn, cid, "Job A")
-        jid2 = _insert_job(conn, cid, "Job B")
-        aid1 = _insert_application(conn, jid1)
-        aid2 = _insert_application(conn, jid2)
+        cid = _insert_company(db)
+        jid1 = _insert_job(db, cid, "Job A")
+        jid2 = _insert_job(db, cid, "Job B")
+        aid1 = _insert_application(db, jid1)
+        aid2 = _insert_application(db, jid2)
 
-        record_resume_variant(conn, aid1, "technical_focus")
-        record_resume_variant(conn, aid2, "technical_focus")
-        record_resume_variant(conn, aid2, "leadership_focus")
+        record_resume_variant(db, aid1, "technical_focus")
+        record_resume_variant(db, aid2, "technical_focus")
+        record_resume_variant(db, aid2, "leadership_focus")
 
-        record_outcome(conn, aid1, "phone_screen")  # positive
-        record_outcome(conn, aid2, "rejection_auto")  # negative
+        record_outcome(db, aid1, "phone_screen")  # positive
+        record_outcome(db, aid2, "rejection_auto")  # negative
 
-        result = analyze_variant_performance(conn)
+        result = analyze_variant_performance(db)
         assert result["has_data"] is True
         assert "technical_focus" in result["variants"]
         assert result["variants"]["technical_focus"]["total_uses"] == 2
 
     def test_success_rate_calculation(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid1 = _insert_job(conn, cid, "Job A")
-        jid2 = _insert_job(conn, cid, "Job B")
-        aid1 = _insert_application(conn, jid1)
-        aid2 = _insert_application(conn, jid2)
-
-        record_resume_variant(conn, aid1, "tech")
-        record_resume_variant(conn, aid2, "tech")
-        record_outcome(conn, aid1, "phone_screen")  # positive
-        record_outcome(conn, aid2, "rejection_auto")  # negative
-
-        result = analyze_variant_performance(conn)
+        cid = _insert_company(db)
+        jid1 = _insert_job(db, cid, "Job A")
+        jid2 = _insert_job(db, cid, "Job B")
+        aid1 = _insert_application(db, jid1)
+        aid2 = _insert_application(db, jid2)
+
+        record_resume_variant(db, aid1, "tech")
+        record_resume_variant(db, aid2, "tech")
+        record_outcome(db, aid1, "phone_screen")  # positive
+        record_outcome(db, aid2, "rejection_auto")  # negative
+
+        result = analyze_variant_performance(db)
         assert result["variants"]["tech"]["success_rate"] == 50.0
 
 
 class TestSuggestVariant:
     def test_no_data(self, db):
-        conn, _ = db
-        result = suggest_variant_for_job(conn, 1)
+        result = suggest_variant_for_job(db, 1)
         assert result is None
 
     def test_suggest_best(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
+        cid = _insert_company(db)
         # Create multiple applications with variants
-        for i in range(3):
-            jid = _insert_job(conn, cid, f"Job {i}")
-            aid = _insert_application(conn, jid)
-            record_resume_variant(conn, aid, "tech")
-            record_outcome(conn, aid, "phone_screen")
-
-        for i in range(3, 6):
-            jid = _insert_job(conn, cid, f"Job {i}")
-            aid = _insert_application(conn, jid)
-            record_resume_variant(conn, aid, "generic")
-            record_outcome(conn, aid, "rejection_auto")
-
-        result = suggest_variant_for_job(conn, 1)
+        specs = [(f"Job {i}", "tech", "phone_screen") for i in range(3)]
+        specs += [(f"Job {i}", "generic", "rejection_auto") for i in range(3, 6)]
+        _bulk_setup(db, cid, specs)
+
+        result = suggest_variant_for_job(db, 1)
         assert result == "tech"
 
 
 class TestVariantReport:
     def test_report_no_data(self, db):
-        conn, _ = db
-        report = generate_variant_report(conn)
+        report = generate_variant_report(db)
         assert "Variant Effectiveness" in report
         assert "No variant data" in report
 
     def test_report_with_data(self, db):
-        conn, _ = db
-        cid = _insert_company(conn)
-        jid = _insert_job(conn, cid)
-        aid = _insert_application(conn, jid)
-        record_resume_variant(conn, aid, "technical")
-        record_outcome(conn, aid, "phone_screen")
-
-        report = generate_variant_report(conn)
+        cid = _insert_company(db)
+        jid = _insert_job(db, cid)
+        aid = _insert_application(db, jid)
+        record_resume_variant(db, aid, "technical")
+        record_outcome(db, aid, "phone_screen")
+
+        report = generate_variant_report(db)
         assert "Variant Performance" in report
         assert "technical" in report
 
 
 # --- CLI Commands ---
 
+@pytest.fixture(scope="module")
+def cli_app():
+    """The typer app, imported only when a CLI test runs (beacon.cli is a heavy import)."""
+    from beacon.cli import app
+
+    return app
+
+
 class TestScoringCLI:
-    def test_scoring_feedback_command(self, db):
-        from beacon.cli import app
-        conn, _ = db
-        with patch("beacon.cli.get_connection", return_value=conn):
-            result = runner.invoke(app, ["report", "scoring-feedback"])
+    def test_scoring_feedback_command(self, cli_app, db):
+        with patch("beacon.cli.get_connection", return_value=db):
+            result = runner.invoke(cli_app, ["report", "scoring-feedback"])
             assert result.exit_code == 0
 
-    def test_variant_effectiveness_command(self, db):
-        from beacon.cli import app
-        conn, _ = db
-        with patch("beacon.cli.get_connection", return_value=conn):
-            result = runner.invoke(app, ["report", "variant-effectiveness"])
+    def test_variant_effectiveness_command(self, cli_app, db):
+        with patch("beacon.cli.get_connection", return_value=db):
+            result = runner.invoke(cli_app, ["report", "variant-effectiveness"])
             assert result.exit_code == 0